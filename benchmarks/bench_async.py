@@ -0,0 +1,78 @@
+import os
+import io
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Make the checkout importable when run as `python benchmarks/bench_async.py`.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vit import VitV1, AsyncVit  # noqa: E402
+
+
+def make_repos(root, repos, files):
+    paths = []
+    for r in range(repos):
+        repo_path = os.path.join(root, f"repo{r}")
+        os.makedirs(repo_path)
+        VitV1(repo_path=repo_path).init()
+        for f in range(files):
+            with open(os.path.join(repo_path, f"file{f}.txt"), "w") as file:
+                file.write(f"repo {r} file {f}\n" * 20)
+        paths.append(repo_path)
+    return paths
+
+
+def bench_sync(paths, files):
+    names = [f"file{f}.txt" for f in range(files)]
+    # The sync API reports through print(), keep it out of the timings output.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for repo_path in paths:
+            vit = VitV1(repo_path=repo_path)
+            for name in names:
+                vit.add(name)
+            vit.commit("snapshot")
+
+
+async def bench_async(paths, files, workers):
+    names = [f"file{f}.txt" for f in range(files)]
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    async def snapshot(repo_path):
+        vit = AsyncVit(repo_path, executor=executor)
+        await vit.add(*names)
+        await vit.commit("snapshot")
+
+    await asyncio.gather(*(snapshot(repo_path) for repo_path in paths))
+    executor.shutdown(wait=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare VitV1 and AsyncVit snapshots")
+    parser.add_argument("--repos", type=int, default=500, help="Number of repos")
+    parser.add_argument("--files", type=int, default=10, help="Files per repo")
+    parser.add_argument("--workers", type=int, default=8, help="Executor size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = make_repos(os.path.join(root, "sync"), args.repos, args.files)
+        start = time.perf_counter()
+        bench_sync(paths, args.files)
+        sync_time = time.perf_counter() - start
+
+        paths = make_repos(os.path.join(root, "async"), args.repos, args.files)
+        start = time.perf_counter()
+        asyncio.run(bench_async(paths, args.files, args.workers))
+        async_time = time.perf_counter() - start
+
+    print(f"repos={args.repos} files={args.files} workers={args.workers}")
+    print(f"VitV1:    {sync_time:.3f}s ({args.repos / sync_time:.1f} repos/s)")
+    print(f"AsyncVit: {async_time:.3f}s ({args.repos / async_time:.1f} repos/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,7 @@ setup(
         "License :: OSI Approved :: MIT License",  # Update license if needed
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',  # Adjust the Python version requirement if needed
+    python_requires='>=3.7',  # Adjust the Python version requirement if needed
     install_requires=[  # List any third-party dependencies here (e.g., `argparse`, `requests`, etc.)
         # 'argparse',  # 'argparse' is in the Python Standard Library, so you don't need to include it.
     ],
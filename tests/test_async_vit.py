@@ -0,0 +1,180 @@
+import os
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vit import AsyncVit, VitV1
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo_path = str(tmp_path)
+    VitV1(repo_path=repo_path).init()
+    for name, content in (("a.txt", "alpha\n"), ("b.txt", "beta\n")):
+        (tmp_path / name).write_text(content)
+    return repo_path
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_add_returns_staged_oids(repo):
+    vit = AsyncVit(repo)
+    added = run(vit.add("a.txt", "b.txt"))
+
+    a_path = os.path.join(repo, "a.txt")
+    b_path = os.path.join(repo, "b.txt")
+    assert set(added) == {a_path, b_path}
+    with open(vit.vit.index_path) as index:
+        assert json.load(index) == added
+    assert run(vit.read_objects([added[a_path]])) == ["alpha\n"]
+
+
+def test_add_missing_file_raises(repo):
+    with pytest.raises(RuntimeError):
+        run(AsyncVit(repo).add("missing.txt"))
+
+
+def test_commit_with_nothing_staged_returns_none(repo):
+    assert run(AsyncVit(repo).commit("empty")) is None
+
+
+def test_commit_is_readable_by_vitv1(repo):
+    vit = AsyncVit(repo)
+    added = run(vit.add("a.txt"))
+    commit = run(vit.commit("first"))
+
+    sync = VitV1(repo_path=repo)
+    assert commit["branch"] == "main"
+    assert commit["parent"] == ""
+    assert sync.get_current_commit() == commit["oid"]
+    with open(sync.index_path) as index:
+        assert json.load(index) == {}
+    with open(os.path.join(sync.object_dir, commit["oid"])) as commit_file:
+        stored = json.load(commit_file)
+    assert stored["message"] == "first"
+    tree = json.loads(sync.read_file(os.path.join(sync.object_dir, stored["tree"])))
+    assert tree == added
+
+
+def test_log_follows_parents_and_respects_limit(repo):
+    vit = AsyncVit(repo)
+    oids = []
+    for message in ("one", "two", "three"):
+        with open(os.path.join(repo, "a.txt"), "w") as file:
+            file.write(message)
+        run(vit.add("a.txt"))
+        oids.append(run(vit.commit(message))["oid"])
+
+    history = run(vit.log())
+    assert [entry["oid"] for entry in history] == oids[::-1]
+    assert [entry["message"] for entry in history] == ["three", "two", "one"]
+    assert history[0]["parent"] == oids[1]
+    assert history[-1]["parent"] == ""
+    assert [entry["oid"] for entry in run(vit.log(limit=2))] == oids[:0:-1]
+    assert run(vit.log(branch="other")) == []
+
+
+def test_diff(repo):
+    vit = AsyncVit(repo)
+    run(vit.add("a.txt"))
+    a_path = os.path.join(repo, "a.txt")
+    b_path = os.path.join(repo, "b.txt")
+
+    assert run(vit.diff("a.txt", "b.txt")) == {a_path: "", b_path: None}
+
+    with open(a_path, "w") as file:
+        file.write("changed\n")
+    diff = run(vit.diff("a.txt"))[a_path]
+    assert "-alpha" in diff
+    assert "+changed" in diff
+
+
+def test_write_and_read_objects_round_trip_in_order(repo):
+    vit = AsyncVit(repo)
+    datas = ["x", "y", "x", "z"]
+    oids = run(vit.write_objects(datas))
+
+    assert len(oids) == 4
+    assert oids[0] == oids[2]
+    assert run(vit.read_objects(oids)) == datas
+    assert [VitV1(repo_path=repo).hash_objects(data) for data in datas] == oids
+
+
+def test_concurrent_add_and_diff_never_see_partial_index(repo):
+    names = [f"f{i}.txt" for i in range(8)]
+    for name in names:
+        with open(os.path.join(repo, name), "w") as file:
+            file.write(name * 200)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            vit = AsyncVit(repo, executor=executor)
+            (oid,) = (await vit.add("f0.txt")).values()
+            for _ in range(50):
+                await asyncio.gather(
+                    *[vit.add(name) for name in names],
+                    *[vit.diff("f0.txt") for _ in names],
+                    *[vit.read_objects([oid]) for _ in names],
+                )
+            return await vit.diff(*names), await vit.read_objects([oid])
+
+    diffs, objects = run(main())
+    assert all(diff == "" for diff in diffs.values())
+    assert objects == ["f0.txt" * 200]
+
+
+def test_concurrent_adds_from_separate_instances_all_stage(repo):
+    names = [f"f{i}.txt" for i in range(50)]
+    for name in names:
+        with open(os.path.join(repo, name), "w") as file:
+            file.write(name)
+
+    async def main():
+        await asyncio.gather(*(AsyncVit(repo).add(name) for name in names))
+
+    run(main())
+    with open(VitV1(repo_path=repo).index_path) as index:
+        staged = json.load(index)
+    assert set(staged) == {os.path.join(repo, name) for name in names}
+
+
+def test_concurrent_commits_from_separate_instances_chain(repo):
+    async def snapshot(i):
+        vit = AsyncVit(repo)
+        with open(os.path.join(repo, "a.txt"), "w") as file:
+            file.write(str(i))
+        await vit.add("a.txt")
+        return await vit.commit(f"commit {i}")
+
+    async def main():
+        return await asyncio.gather(*(snapshot(i) for i in range(20)))
+
+    commits = [commit for commit in run(main()) if commit is not None]
+    history = run(AsyncVit(repo).log())
+    assert {entry["oid"] for entry in history} == {c["oid"] for c in commits}
+
+
+def test_instance_is_reusable_across_event_loops(repo):
+    vit = AsyncVit(repo)
+
+    async def main():
+        return await asyncio.gather(vit.add("a.txt"), vit.add("b.txt"))
+
+    for _ in range(2):
+        run(main())
+
+
+def test_written_files_follow_umask_and_leave_refs_clean(repo):
+    vit = AsyncVit(repo)
+    run(vit.add("a.txt"))
+    commit = run(vit.commit("first"))
+
+    umask = os.umask(0)
+    os.umask(umask)
+    object_path = os.path.join(vit.vit.object_dir, commit["oid"])
+    assert os.stat(object_path).st_mode & 0o777 == 0o666 & ~umask
+    assert os.listdir(os.path.join(vit.vit.refs_dir, "heads")) == ["main"]
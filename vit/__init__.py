@@ -1 +1,2 @@
-from .vit_v1 import VitV1
\ No newline at end of file
+from .vit_v1 import VitV1
+from .async_vit import AsyncVit
\ No newline at end of file
@@ -0,0 +1,278 @@
+import os
+import json
+import asyncio
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from difflib import unified_diff
+from concurrent.futures import ThreadPoolExecutor
+
+from .vit_v1 import VitV1
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+_repo_locks = {}
+_repo_locks_lock = threading.Lock()
+
+# os.umask can only be read by setting it, so sample it once at import time.
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    """
+    Returns the bounded thread pool shared by every AsyncVit created without
+    an explicit executor, creating it on first use.
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="vit",
+            )
+        return _shared_executor
+
+
+def _repo_lock(repo_path: str) -> threading.Lock:
+    """
+    Returns the lock guarding the index and refs of the repo at `repo_path`,
+    shared by every AsyncVit opened on that repo in this process.
+    """
+    key = os.path.realpath(repo_path)
+    with _repo_locks_lock:
+        return _repo_locks.setdefault(key, threading.Lock())
+
+
+class AsyncVit:
+    def __init__(self, repo_path, executor=None):
+        self.vit = VitV1(repo_path=repo_path)
+        # All instances share one bounded pool unless the caller passes its
+        # own executor, which the caller then owns and shuts down.
+        self._executor = executor or _default_executor()
+        self._repo_lock = _repo_lock(repo_path)
+        # Every blocking call below runs in self._executor, never on the loop:
+        # AsyncVit
+        # ├── read_objects / write_objects   # batched object I/O, one job each
+        # ├── add / commit                   # serialised per repo on disk
+        # └── diff / log                     # read-only, return results
+        # Index, refs and objects are replaced atomically, so readers never
+        # see a partially written file.
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _write_atomic(self, path: str, data: str) -> None:
+        # Write inside .vit (same filesystem, outside objects/ and refs/ so a
+        # leftover temp file is never listed), then swap it in with a rename.
+        fd, tmp_path = tempfile.mkstemp(dir=self.vit.git_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(data)
+            # mkstemp creates the file as 0600, match a plain open() instead.
+            os.chmod(tmp_path, 0o666 & ~_umask)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _read_json(self, path: str):
+        with open(path, "r") as file:
+            return json.load(file)
+
+    def _write_json(self, path: str, data) -> None:
+        self._write_atomic(path, json.dumps(data))
+
+    def _read_objects(self, oids):
+        return [
+            self.vit.read_file(os.path.join(self.vit.object_dir, oid)) for oid in oids
+        ]
+
+    def _hash_object(self, data: str) -> str:
+        oid = hashlib.sha1(data.encode()).hexdigest()
+        self._write_atomic(os.path.join(self.vit.object_dir, oid), data)
+        return oid
+
+    def _write_objects(self, datas):
+        return [self._hash_object(data) for data in datas]
+
+    async def read_objects(self, oids) -> list:
+        """
+        Reads several objects from the object store in a single executor job.
+        Args:
+            oids (list): The object IDs to read.
+        Returns:
+            list: The object contents, in the same order as `oids`.
+        """
+        try:
+            return await self._run(self._read_objects, list(oids))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to read objects: {e}")
+
+    async def write_objects(self, datas) -> list:
+        """
+        Hashes and stores several objects in a single executor job.
+        Args:
+            datas (list): The data to hash and store.
+        Returns:
+            list: The object IDs, in the same order as `datas`.
+        """
+        try:
+            return await self._run(self._write_objects, list(datas))
+        except (asyncio.CancelledError, RuntimeError):
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to write objects: {e}")
+
+    def _add(self, files):
+        file_paths = [os.path.join(self.vit.repo_path, file) for file in files]
+        oids = self._write_objects([self.vit.read_file(path) for path in file_paths])
+        added = dict(zip(file_paths, oids))
+
+        with self._repo_lock:
+            staged = self._read_json(self.vit.index_path)
+            staged.update(added)
+            self._write_json(self.vit.index_path, staged)
+        return added
+
+    async def add(self, *files: str) -> dict:
+        """
+        Stages the given files, updating the index once for the whole batch.
+        Args:
+            files (str): Files that need to be added.
+        Returns:
+            dict: Mapping of each staged file path to its object ID.
+        Raises:
+            RuntimeError: If a file is missing or the index cannot be updated.
+        """
+        try:
+            return await self._run(self._add, files)
+        except asyncio.CancelledError:
+            raise
+        except FileNotFoundError as e:
+            raise RuntimeError(f"File not found while adding: {e}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred while adding the files: {e}")
+
+    def _commit(self, message):
+        with self._repo_lock:
+            return self._commit_locked(message)
+
+    def _commit_locked(self, message):
+        staged = self._read_json(self.vit.index_path)
+        if not staged:
+            return None
+        parent = self.vit.get_current_commit()
+        tree_oid = self._hash_object(json.dumps(staged))
+        commit_content = {
+            "tree": tree_oid,
+            "parent": parent,
+            "message": message,
+            "timestamp": datetime.now().isoformat(),
+        }
+        commit_oid = self._hash_object(json.dumps(commit_content))
+        branch = self.vit.get_current_branch()
+        branch_ref = os.path.join(self.vit.refs_dir, "heads", branch)
+        self._write_atomic(branch_ref, commit_oid)
+
+        self._write_json(self.vit.index_path, {})
+        return dict(commit_content, oid=commit_oid, branch=branch)
+
+    async def commit(self, message: str):
+        """
+        Creates a new commit with the given message.
+        Args:
+            message (str): The commit message.
+        Returns:
+            dict: The commit (`oid`, `branch`, `tree`, `parent`, `message`,
+            `timestamp`), or None if nothing is staged.
+        Raises:
+            RuntimeError: If an error occurs during the commit process.
+        """
+        try:
+            return await self._run(self._commit, message)
+        except asyncio.CancelledError:
+            raise
+        except FileNotFoundError as e:
+            raise RuntimeError(f"File not found during commit process: {e}")
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Invalid JSON format in index file: {e}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred while committing: {e}")
+
+    def _diff(self, files):
+        staged = self._read_json(self.vit.index_path)
+        diffs = {}
+        for file in files:
+            file_path = os.path.join(self.vit.repo_path, file)
+            if file_path not in staged:
+                diffs[file_path] = None
+                continue
+            staged_content = self._read_objects([staged[file_path]])[0]
+            current_content = self.vit.read_file(file_path)
+            diff = unified_diff(
+                staged_content.splitlines(),
+                current_content.splitlines(),
+                fromfile="Staged",
+                tofile="Current",
+                lineterm="",
+            )
+            diffs[file_path] = "\n".join(diff)
+        return diffs
+
+    async def diff(self, *files: str) -> dict:
+        """
+        Shows the differences between the current files and their staged versions.
+        Args:
+            files (str): The files to compare.
+        Returns:
+            dict: Mapping of each file path to its unified diff, an empty
+            string if unchanged, or None if the file is not staged.
+        Raises:
+            RuntimeError: If a file or its staged version cannot be read.
+        """
+        try:
+            return await self._run(self._diff, files)
+        except asyncio.CancelledError:
+            raise
+        except FileNotFoundError as e:
+            raise RuntimeError(f"File not found while generating the diff: {e}")
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Invalid JSON format in index file: {e}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred while generating the diff: {e}")
+
+    def _log(self, branch, limit):
+        if branch is None:
+            branch = self.vit.get_current_branch()
+        node = self.vit.get_branch_last_commit(branch)
+        history = []
+        while node and (limit is None or len(history) < limit):
+            commit_content = self._read_json(os.path.join(self.vit.object_dir, node))
+            history.append(dict(commit_content, oid=node))
+            node = commit_content["parent"]
+        return history
+
+    async def log(self, branch: str = None, limit: int = None) -> list:
+        """
+        Walks the commit history of a branch, newest first.
+        Args:
+            branch (str): The branch to walk. Defaults to the current branch.
+            limit (int): Maximum number of commits to return.
+        Returns:
+            list: The commits, each with `oid`, `tree`, `parent`, `message`
+            and `timestamp`.
+        Raises:
+            RuntimeError: If the history cannot be read.
+        """
+        try:
+            return await self._run(self._log, branch, limit)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"An error occurred while reading the history: {e}")